@@ -2,18 +2,39 @@
 Database configuration settings for the Inventory Management System.
 """
 
+import functools
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from a .env file, if one exists. The existence
+# check avoids importing python-dotenv (and its filesystem walk) in
+# production, where configuration comes from the environment directly.
+_DOTENV_PATH = os.environ.get("DOTENV_PATH", ".env")
+if os.path.exists(_DOTENV_PATH):
+    from dotenv import load_dotenv
 
+    load_dotenv(_DOTENV_PATH, override=False)
 
-@dataclass
+
+def _default_pool_size() -> int:
+    """Default pool size scaled to the host instead of a fixed 5.
+
+    A static pool_size=5 exhausts quickly under multi-worker deployments;
+    two connections per CPU (minimum 5) is a reasonable default that can
+    still be overridden with DB_POOL_SIZE.
+    """
+    return max(5, (os.cpu_count() or 4) * 2)
+
+
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
-    """Database connection configuration."""
+    """Database connection configuration.
+
+    Frozen with __slots__: the instance is a read-heavy singleton, so
+    slot-based attribute access is faster and cheaper than a __dict__,
+    and frozen makes it hashable for the lru_cache'd factories.
+    """
 
     host: str
     port: int
@@ -27,57 +48,69 @@ class DatabaseConfig:
     pool_recycle: int = 3600  # 1 hour
     echo: bool = False  # Set to True for SQL query logging
 
-    @property
-    def connection_url(self) -> str:
-        """Generate SQLAlchemy connection URL."""
-        return (
-            f"postgresql://{self.username}:{self.password}"
-            f"@{self.host}:{self.port}/{self.database}"
-        )
+    # Connection URLs, precomputed in __post_init__ (slots=True removes
+    # the per-instance __dict__ that cached_property would need). The sync
+    # URL uses the psycopg (v3) driver, which decodes result rows in C.
+    connection_url: str = field(init=False, repr=False, compare=False, default="")
+    connection_url_async: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        from urllib.parse import quote_plus
 
-    @property
-    def connection_url_async(self) -> str:
-        """Generate async SQLAlchemy connection URL."""
-        return (
-            f"postgresql+asyncpg://{self.username}:{self.password}"
-            f"@{self.host}:{self.port}/{self.database}"
+        # URL-quote credentials so passwords with '@' or ':' stay valid
+        credentials = f"{quote_plus(self.username)}:{quote_plus(self.password)}"
+        suffix = f"@{self.host}:{self.port}/{self.database}"
+        object.__setattr__(
+            self, "connection_url", f"postgresql+psycopg://{credentials}{suffix}"
+        )
+        object.__setattr__(
+            self, "connection_url_async", f"postgresql+asyncpg://{credentials}{suffix}"
         )
 
     @classmethod
     def from_env(cls) -> "DatabaseConfig":
         """Create configuration from environment variables."""
+        # Read the environment once instead of one os.getenv call per field
+        env = os.environ
+
         # Check if DATABASE_URL is provided (common in production)
-        database_url = os.getenv("DATABASE_URL")
+        database_url = env.get("DATABASE_URL")
         if database_url:
             return cls.from_url(database_url)
 
+        # Size the pool for the host unless explicitly overridden
+        pool_size = int(env.get("DB_POOL_SIZE", str(_default_pool_size())))
+
         # Otherwise, use individual environment variables
         return cls(
-            host=os.getenv("DB_HOST", "localhost"),
-            port=int(os.getenv("DB_PORT", "5432")),
-            database=os.getenv("DB_NAME", "inventory_management"),
-            username=os.getenv("DB_USER", "postgres"),
-            password=os.getenv("DB_PASSWORD", ""),
-            schema=os.getenv("DB_SCHEMA", "public"),
-            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
-            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
-            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
-            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
-            echo=os.getenv("DB_ECHO", "False").lower() == "true",
+            host=env.get("DB_HOST", "localhost"),
+            port=int(env.get("DB_PORT", "5432")),
+            database=env.get("DB_NAME", "inventory_management"),
+            username=env.get("DB_USER", "postgres"),
+            password=env.get("DB_PASSWORD", ""),
+            schema=env.get("DB_SCHEMA", "public"),
+            pool_size=pool_size,
+            max_overflow=int(env.get("DB_MAX_OVERFLOW", str(pool_size * 2))),
+            pool_timeout=int(env.get("DB_POOL_TIMEOUT", "30")),
+            pool_recycle=int(env.get("DB_POOL_RECYCLE", "3600")),
+            echo=env.get("DB_ECHO", "False").lower() == "true",
         )
 
     @classmethod
     def from_url(cls, database_url: str) -> "DatabaseConfig":
         """Create configuration from database URL."""
-        from urllib.parse import urlparse
+        from urllib.parse import unquote, urlparse
 
+        # urlparse does not percent-decode userinfo; unquote here so the
+        # stored credentials are plain text and __post_init__'s quoting
+        # doesn't double-encode them in the connection URLs.
         parsed = urlparse(database_url)
         return cls(
             host=parsed.hostname or "localhost",
             port=parsed.port or 5432,
             database=parsed.path.lstrip("/") if parsed.path else "inventory_management",
-            username=parsed.username or "postgres",
-            password=parsed.password or "",
+            username=unquote(parsed.username) if parsed.username else "postgres",
+            password=unquote(parsed.password) if parsed.password else "",
         )
 
     def validate(self) -> bool:
@@ -95,7 +128,7 @@ class DatabaseConfig:
         return True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application configuration settings."""
 
@@ -122,40 +155,72 @@ class AppConfig:
     @classmethod
     def from_env(cls) -> "AppConfig":
         """Create configuration from environment variables."""
+        # Read the environment once instead of one os.getenv call per field.
+        # With slots=True the field defaults are no longer class attributes,
+        # so take them from a default-constructed instance.
+        env = os.environ
+        defaults = cls()
+
         return cls(
-            name=os.getenv("APP_NAME", cls.name),
-            version=os.getenv("APP_VERSION", cls.version),
-            debug=os.getenv("DEBUG", "False").lower() == "true",
-            log_level=os.getenv("LOG_LEVEL", cls.log_level),
-            window_width=int(os.getenv("WINDOW_WIDTH", str(cls.window_width))),
-            window_height=int(os.getenv("WINDOW_HEIGHT", str(cls.window_height))),
-            theme=os.getenv("THEME", cls.theme),
-            default_currency=os.getenv("DEFAULT_CURRENCY", cls.default_currency),
+            name=env.get("APP_NAME", defaults.name),
+            version=env.get("APP_VERSION", defaults.version),
+            debug=env.get("DEBUG", "False").lower() == "true",
+            log_level=env.get("LOG_LEVEL", defaults.log_level),
+            window_width=int(env.get("WINDOW_WIDTH", str(defaults.window_width))),
+            window_height=int(env.get("WINDOW_HEIGHT", str(defaults.window_height))),
+            theme=env.get("THEME", defaults.theme),
+            default_currency=env.get("DEFAULT_CURRENCY", defaults.default_currency),
             low_stock_threshold=int(
-                os.getenv("LOW_STOCK_THRESHOLD", str(cls.low_stock_threshold))
+                env.get("LOW_STOCK_THRESHOLD", str(defaults.low_stock_threshold))
             ),
             backup_interval_hours=int(
-                os.getenv("BACKUP_INTERVAL_HOURS", str(cls.backup_interval_hours))
+                env.get("BACKUP_INTERVAL_HOURS", str(defaults.backup_interval_hours))
             ),
-            export_path=os.getenv("EXPORT_PATH", cls.export_path),
-            backup_path=os.getenv("BACKUP_PATH", cls.backup_path),
-            log_path=os.getenv("LOG_PATH", cls.log_path),
+            export_path=env.get("EXPORT_PATH", defaults.export_path),
+            backup_path=env.get("BACKUP_PATH", defaults.backup_path),
+            log_path=env.get("LOG_PATH", defaults.log_path),
         )
 
 
+# Cached factories so repeated config lookups don't re-parse the environment
+@functools.lru_cache(maxsize=1)
+def _cached_db_config() -> DatabaseConfig:
+    """Build (once) and cache the database configuration."""
+    return DatabaseConfig.from_env()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_app_config() -> AppConfig:
+    """Build (once) and cache the application configuration."""
+    return AppConfig.from_env()
+
+
 # Global configuration instances
-db_config = DatabaseConfig.from_env()
-app_config = AppConfig.from_env()
+db_config = _cached_db_config()
+app_config = _cached_app_config()
 
 
 def get_database_config() -> DatabaseConfig:
     """Get the database configuration instance."""
-    return db_config
+    return _cached_db_config()
 
 
 def get_app_config() -> AppConfig:
     """Get the application configuration instance."""
-    return app_config
+    return _cached_app_config()
+
+
+def reload_config() -> None:
+    """Clear the cached configuration and rebuild it from the environment.
+
+    Mainly useful in tests that mutate environment variables.
+    """
+    global db_config, app_config
+
+    _cached_db_config.cache_clear()
+    _cached_app_config.cache_clear()
+    db_config = _cached_db_config()
+    app_config = _cached_app_config()
 
 
 def validate_config() -> bool:
@@ -3,10 +3,12 @@ Database connection management for the Inventory Management System.
 """
 
 import logging
+import os
+import time
 from contextlib import contextmanager
 from typing import Generator, Optional
+from urllib.parse import quote_plus
 
-import psycopg2
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
@@ -15,8 +17,8 @@ from sqlalchemy.pool import QueuePool
 
 from config.database import get_database_config
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers/levels are configured by the application
+# entrypoint, not as an import side effect.
 logger = logging.getLogger(__name__)
 
 
@@ -39,7 +41,12 @@ class DatabaseManager:
     def session_factory(self) -> sessionmaker:
         """Get or create the session factory."""
         if self._session_factory is None:
-            self._session_factory = sessionmaker(bind=self.engine)
+            # expire_on_commit=False keeps attribute values usable after
+            # commit instead of re-fetching them on next access, saving a
+            # round trip for the common commit-then-read pattern.
+            self._session_factory = sessionmaker(
+                bind=self.engine, expire_on_commit=False
+            )
         return self._session_factory
 
     def _create_engine(self) -> None:
@@ -52,20 +59,55 @@ class DatabaseManager:
                 max_overflow=self.config.max_overflow,
                 pool_timeout=self.config.pool_timeout,
                 pool_recycle=self.config.pool_recycle,
+                pool_use_lifo=True,  # reuse hot connections, let idle ones be recycled
                 echo=self.config.echo,
-                pool_pre_ping=True,
+                # TCP keepalives (below) detect dead connections at the OS
+                # level, so the extra SELECT 1 round trip pre_ping issued on
+                # every checkout is no longer needed; pool_recycle still
+                # cycles connections proactively.
+                pool_pre_ping=False,
                 connect_args={
                     "options": f"-csearch_path={self.config.schema}",
                     "sslmode": "prefer",
                     "connect_timeout": 10,
                     "application_name": "inventory_management_system",
+                    # Probe idle connections so ones silently dropped by
+                    # NAT/load balancers are noticed by the kernel
+                    "keepalives": 1,
+                    "keepalives_idle": 30,
+                    "keepalives_interval": 10,
+                    "keepalives_count": 5,
+                    # Fail hung sends after 30s instead of waiting on TCP
+                    # retransmission timeouts (Linux only)
+                    "tcp_user_timeout": 30000,
                 },
             )
 
+            self._warm_pool()
+
         except Exception as e:
-            logger.error(f"Failed to create database engine: {e}")
+            logger.error("Failed to create database engine: %s", e)
             raise
 
+    def _warm_pool(self) -> None:
+        """Pre-create pooled connections so early requests skip the handshake.
+
+        QueuePool is lazy by default, which makes the first pool_size
+        requests each pay the TCP + auth handshake. Checking out and
+        releasing pool_size connections up front fills the pool once at
+        startup instead.
+        """
+        connections = []
+        try:
+            for _ in range(self.config.pool_size):
+                connections.append(self._engine.connect())
+        except Exception as e:
+            # The database may simply not be up yet; the pool stays lazy.
+            logger.warning("Connection pool warmup skipped: %s", e)
+        finally:
+            for connection in reversed(connections):
+                connection.close()
+
     def test_connection(self) -> bool:
         """Test the database connection."""
         try:
@@ -75,15 +117,27 @@ class DatabaseManager:
             logger.info("Database connection test successful")
             return True
         except Exception as e:
-            logger.error(f"Database connection test failed: {e}")
+            logger.error("Database connection test failed: %s", e)
             return False
 
     def create_database_if_not_exists(self) -> bool:
         """Create the database if it doesn't exist."""
+        # Deployments where the database is provisioned externally can
+        # skip the admin-connection round trip entirely.
+        if os.environ.get("DB_SKIP_CREATE") == "1":
+            logger.debug("DB_SKIP_CREATE is set; skipping database creation check")
+            return True
+
         try:
+            # Quote credentials the same way the main connection URL does,
+            # so passwords with '@', ':' or '%' keep working here too
             admin_config = self.config
+            credentials = (
+                f"{quote_plus(admin_config.username)}"
+                f":{quote_plus(admin_config.password)}"
+            )
             admin_url = (
-                f"postgresql://{admin_config.username}:{admin_config.password}"
+                f"postgresql+psycopg://{credentials}"
                 f"@{admin_config.host}:{admin_config.port}/postgres"
             )
 
@@ -102,30 +156,33 @@ class DatabaseManager:
                         text(f'CREATE DATABASE "{self.config.database}"')
                     )
                     logger.info(
-                        f"Database '{self.config.database}' created successfully"
+                        "Database '%s' created successfully", self.config.database
                     )
                 else:
-                    logger.info(f"Database '{self.config.database}' already exists")
+                    logger.info("Database '%s' already exists", self.config.database)
 
             admin_engine.dispose()
             return True
 
         except Exception as e:
-            logger.error(f"Failed to create database: {e}")
+            logger.error("Failed to create database: %s", e)
             return False
 
     def run_migrations(self) -> bool:
         """Run database migrations."""
         try:
-            import os
             from pathlib import Path
 
             # Get the directory containing migration files
             current_dir = Path(__file__).parent
             migrations_dir = current_dir / "migrations"
 
-            # Get all SQL migration files
-            migration_files = sorted(migrations_dir.glob("*.sql"))
+            # Get all SQL migration files (scandir avoids the extra stat
+            # calls glob performs per entry)
+            with os.scandir(migrations_dir) as entries:
+                migration_files = sorted(
+                    Path(entry.path) for entry in entries if entry.name.endswith(".sql")
+                )
 
             if not migration_files:
                 logger.warning("No migration files found")
@@ -151,45 +208,53 @@ class DatabaseManager:
                 )
                 applied_migrations = {row[0] for row in result}
 
-                # Apply new migrations
-                for migration_file in migration_files:
-                    migration_name = migration_file.stem
-
-                    if migration_name not in applied_migrations:
-                        logger.info(f"Applying migration: {migration_name}")
-
-                        # Read and execute migration
-                        with open(migration_file, "r", encoding="utf-8") as f:
-                            migration_sql = f.read()
-
-                        # Execute migration in a transaction
-                        trans = connection.begin()
-                        try:
+                pending_files = [
+                    migration_file
+                    for migration_file in migration_files
+                    if migration_file.stem not in applied_migrations
+                ]
+
+                if not pending_files:
+                    logger.info("All migrations already applied")
+                    return True
+
+                # Apply all pending migrations in a single transaction so a
+                # failure rolls back the whole batch, and record the applied
+                # versions with one batched INSERT instead of one per file.
+                # The SELECT above already autobegan a transaction on this
+                # connection (an explicit begin() here would raise), so the
+                # batch reuses it via connection.commit()/rollback().
+                try:
+                    applied_versions = []
+                    for migration_file in pending_files:
+                        migration_name = migration_file.stem
+                        logger.info("Applying migration: %s", migration_name)
+
+                        migration_sql = migration_file.read_text(encoding="utf-8")
+                        if migration_sql.strip():
                             connection.execute(text(migration_sql))
-                            connection.execute(
-                                text(
-                                    "INSERT INTO schema_migrations (version) VALUES (:version)"
-                                ),
-                                {"version": migration_name},
-                            )
-                            trans.commit()
-                            logger.info(
-                                f"Migration {migration_name} applied successfully"
-                            )
-                        except Exception as e:
-                            trans.rollback()
-                            logger.error(
-                                f"Failed to apply migration {migration_name}: {e}"
-                            )
-                            raise
-                    else:
-                        logger.debug(f"Migration {migration_name} already applied")
+                        applied_versions.append({"version": migration_name})
+
+                    connection.execute(
+                        text(
+                            "INSERT INTO schema_migrations (version) VALUES (:version)"
+                        ),
+                        applied_versions,
+                    )
+                    connection.commit()
+                    logger.info(
+                        "Applied %d migration(s) successfully", len(applied_versions)
+                    )
+                except Exception as e:
+                    connection.rollback()
+                    logger.error("Failed to apply migrations: %s", e)
+                    raise
 
             logger.info("All migrations applied successfully")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to run migrations: {e}")
+            logger.error("Failed to run migrations: %s", e)
             return False
 
     @contextmanager
@@ -205,6 +270,20 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @contextmanager
+    def get_readonly_session(self) -> Generator[Session, None, None]:
+        """Get a read-only database session with automatic cleanup.
+
+        Skips the commit on exit and disables autoflush, avoiding the
+        flush/commit round trips that get_session pays even when nothing
+        was modified.
+        """
+        session = self.session_factory(autoflush=False)
+        try:
+            yield session
+        finally:
+            session.close()
+
     def get_session_direct(self) -> Session:
         """Get a database session (manual cleanup required)."""
         return self.session_factory()
@@ -235,13 +314,15 @@ def init_database() -> bool:
         # Validate configuration
         db_manager.config.validate()
 
-        # Create database if it doesn't exist
-        if not db_manager.create_database_if_not_exists():
-            return False
-
-        # Test connection
+        # If the target database already accepts connections it obviously
+        # exists, so the admin-connection existence check is skipped — it
+        # only runs as a fallback on the very first startup.
         if not db_manager.test_connection():
-            return False
+            if not db_manager.create_database_if_not_exists():
+                return False
+
+            if not db_manager.test_connection():
+                return False
 
         # Run migrations
         if not db_manager.run_migrations():
@@ -251,10 +332,47 @@ def init_database() -> bool:
         return True
 
     except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
+        logger.error("Database initialization failed: %s", e)
         return False
 
 
+# Core tables checked by health monitoring
+_CORE_TABLES = ("categories", "suppliers", "products", "inventory", "transactions")
+
+# to_regclass is an O(1) syscache lookup per table, far cheaper than the
+# information_schema.tables view, which materializes catalog joins.
+_TABLES_EXIST_SQL = text(
+    "SELECT "
+    + " AND ".join(
+        f"to_regclass('public.{table}') IS NOT NULL" for table in _CORE_TABLES
+    )
+)
+
+_TABLES_EXIST_TTL_SECONDS = 60.0
+_tables_exist_checked_at: float = 0.0
+
+
+def _core_tables_exist(session: Session) -> bool:
+    """Check that all core tables exist, caching positive results briefly.
+
+    The schema does not disappear at runtime, so a positive answer is
+    cached for a short TTL; negative answers are never cached so a fresh
+    setup is detected immediately.
+    """
+    global _tables_exist_checked_at
+
+    now = time.monotonic()
+    if (
+        _tables_exist_checked_at
+        and now - _tables_exist_checked_at < _TABLES_EXIST_TTL_SECONDS
+    ):
+        return True
+
+    exists = bool(session.execute(_TABLES_EXIST_SQL).scalar())
+    _tables_exist_checked_at = now if exists else 0.0
+    return exists
+
+
 def check_database_health() -> dict:
     """Check database health and return status information."""
     health_info = {
@@ -271,18 +389,8 @@ def check_database_health() -> dict:
 
         if health_info["connection"]:
             with get_db_session() as session:
-                # Check if core tables exist
-                result = session.execute(
-                    text(
-                        """
-                    SELECT COUNT(*) FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_name IN ('categories', 'suppliers', 'products', 'inventory', 'transactions')
-                """
-                    )
-                )
-                table_count = result.scalar()
-                health_info["tables_exist"] = table_count >= 5
+                # Check if core tables exist (cached with a short TTL)
+                health_info["tables_exist"] = _core_tables_exist(session)
 
                 # Check if there's sample data
                 if health_info["tables_exist"]:
@@ -0,0 +1,10 @@
+-- Inventory Management System - Server-side UUID defaults
+-- Created: 2025-08-30
+-- Description: Switch id defaults from uuid_generate_v4() (uuid-ossp
+-- extension) to the built-in gen_random_uuid() available in PostgreSQL 13+.
+
+ALTER TABLE categories ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE suppliers ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE products ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE inventory ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE transactions ALTER COLUMN id SET DEFAULT gen_random_uuid();
@@ -0,0 +1,26 @@
+-- Inventory Management System - Materialized category paths
+-- Created: 2025-08-30
+-- Description: Denormalize the category hierarchy into a path column
+-- ("/root_id/.../self_id/") plus a depth counter so level/ancestor/root
+-- lookups no longer walk parent pointers one query per level.
+
+ALTER TABLE categories ADD COLUMN path VARCHAR(512);
+ALTER TABLE categories ADD COLUMN depth INTEGER NOT NULL DEFAULT 0;
+
+CREATE INDEX idx_categories_path ON categories(path);
+
+-- Backfill existing rows from the parent chain
+WITH RECURSIVE tree(id, path, depth) AS (
+    SELECT id, '/' || id::text || '/', 0
+    FROM categories
+    WHERE parent_id IS NULL
+    UNION ALL
+    SELECT c.id, t.path || c.id::text || '/', t.depth + 1
+    FROM categories c
+    JOIN tree t ON c.parent_id = t.id
+)
+UPDATE categories
+SET path = tree.path,
+    depth = tree.depth
+FROM tree
+WHERE categories.id = tree.id;
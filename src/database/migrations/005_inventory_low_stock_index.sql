@@ -0,0 +1,7 @@
+-- Inventory Management System - Low-stock lookup index
+-- Created: 2025-08-30
+-- Description: Composite index so low-stock checks can resolve the
+-- product join and quantity comparison from the index alone.
+
+CREATE INDEX idx_inventory_product_qty_available
+    ON inventory(product_id, quantity_available);
@@ -0,0 +1,6 @@
+-- Inventory Management System - Case-insensitive category name index
+-- Created: 2025-08-30
+-- Description: Functional index so LOWER(name) equality predicates
+-- (case-insensitive category lookups) can use an index scan.
+
+CREATE INDEX idx_categories_name_lower ON categories (LOWER(name));
@@ -0,0 +1,12 @@
+-- Inventory Management System - Trigram search indexes
+-- Created: 2025-08-30
+-- Description: pg_trgm GIN indexes so the leading-wildcard ILIKE
+-- searches (search_by_name, get_by_city, get_by_country) use an index
+-- scan instead of a sequential scan.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX idx_categories_name_trgm ON categories USING gin (name gin_trgm_ops);
+CREATE INDEX idx_suppliers_name_trgm ON suppliers USING gin (name gin_trgm_ops);
+CREATE INDEX idx_suppliers_city_trgm ON suppliers USING gin (city gin_trgm_ops);
+CREATE INDEX idx_suppliers_country_trgm ON suppliers USING gin (country gin_trgm_ops);
@@ -0,0 +1,11 @@
+-- Inventory Management System - Composite listing indexes
+-- Created: 2025-08-30
+-- Description: Composite indexes matching the WHERE + ORDER BY shape of
+-- the model classmethods (filter on is_active / parent_id / location,
+-- order by name), so those listings become index scans with no sort.
+
+CREATE INDEX idx_categories_active_name ON categories(is_active, name);
+CREATE INDEX idx_categories_parent_active_name ON categories(parent_id, is_active, name);
+CREATE INDEX idx_suppliers_active_name ON suppliers(is_active, name);
+CREATE INDEX idx_suppliers_city_active_name ON suppliers(city, is_active, name);
+CREATE INDEX idx_suppliers_country_active_name ON suppliers(country, is_active, name);
@@ -0,0 +1,8 @@
+-- Inventory Management System - Partial active-row indexes
+-- Created: 2025-08-30
+-- Description: Partial name indexes covering only active rows, which is
+-- what every model getter filters on (is_active IS TRUE). Roughly
+-- halves index size versus a full index on mostly-active datasets.
+
+CREATE INDEX idx_categories_name_active_partial ON categories(name) WHERE is_active;
+CREATE INDEX idx_suppliers_name_active_partial ON suppliers(name) WHERE is_active;
@@ -0,0 +1,14 @@
+-- Inventory Management System - Write-time lowercased category name
+-- Created: 2025-08-30
+-- Description: Adds categories.name_lower, maintained by the model's
+-- validates hook, so case-insensitive lookups compare a plain indexed
+-- column instead of case-folding per query. Supersedes the LOWER(name)
+-- functional index from migration 006.
+
+ALTER TABLE categories ADD COLUMN name_lower VARCHAR(100);
+
+UPDATE categories SET name_lower = LOWER(name);
+
+CREATE INDEX idx_categories_name_lower_col ON categories (name_lower);
+
+DROP INDEX IF EXISTS idx_categories_name_lower;
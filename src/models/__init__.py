@@ -0,0 +1,33 @@
+"""
+Model package for the Inventory Management System.
+
+Importing this package registers every mapped class with the shared
+declarative Base exactly once, so relationship strings resolve
+regardless of which model a caller imports first. The product,
+inventory, and transaction modules are added here as they are
+implemented.
+"""
+
+from .base import (
+    ActiveRecordMixin,
+    Base,
+    BaseModel,
+    SoftDeleteMixin,
+    TimestampMixin,
+    get_all_models,
+    get_model_by_table_name,
+)
+from .category import Category
+from .supplier import Supplier
+
+__all__ = [
+    "ActiveRecordMixin",
+    "Base",
+    "BaseModel",
+    "Category",
+    "SoftDeleteMixin",
+    "Supplier",
+    "TimestampMixin",
+    "get_all_models",
+    "get_model_by_table_name",
+]
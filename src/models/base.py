@@ -2,11 +2,14 @@
 Base model classes for the Inventory Management System.
 """
 
+import functools
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from decimal import Decimal
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
 
-from sqlalchemy import DateTime, String, Boolean, func, text
+import orjson
+from sqlalchemy import DateTime, String, Boolean, func, insert, inspect, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Mapped, mapped_column
@@ -15,6 +18,17 @@ from sqlalchemy.orm import Mapped, mapped_column
 Base = declarative_base()
 
 
+# Sentinel distinguishing "attribute not in __dict__" from a stored None
+_MISSING = object()
+
+
+def _orjson_default(value: Any) -> Any:
+    """Fallback serializer for types orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
 class BaseModel(Base):
     """
     Abstract base model class with common fields and methods.
@@ -22,12 +36,24 @@ class BaseModel(Base):
 
     __abstract__ = True
 
-    # Primary key using UUID
+    # Registry of concrete models keyed by table name, maintained by
+    # __init_subclass__ so lookups are O(1) dict gets instead of scans
+    # over SQLAlchemy's private class registry.
+    _TABLE_INDEX: Dict[str, type] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "__tablename__"):
+            BaseModel._TABLE_INDEX[cls.__tablename__] = cls
+
+    # Primary key using UUID, generated server-side. A Python-side
+    # default would call uuid.uuid4() (an os.urandom syscall) on every
+    # insert and shadow the server default entirely; gen_random_uuid()
+    # is built into PostgreSQL 13+ and needs no extension.
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("uuid_generate_v4()"),
+        server_default=text("gen_random_uuid()"),
     )
 
     # Timestamp fields
@@ -47,6 +73,29 @@ class BaseModel(Base):
         class_name = self.__class__.__name__
         return f"<{class_name}(id={self.id})>"
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _column_names(cls) -> FrozenSet[str]:
+        """Cached set of column names (table introspection is done once)."""
+        return frozenset(column.name for column in cls.__table__.columns)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _columns_tuple(cls) -> Tuple[Tuple[str, bool, bool], ...]:
+        """Cached (name, is_uuid, is_datetime) tuples for serialization.
+
+        Precomputing the type flags lets to_dict skip per-value isinstance
+        checks on every row.
+        """
+        return tuple(
+            (
+                column.name,
+                isinstance(column.type, UUID),
+                isinstance(column.type, DateTime),
+            )
+            for column in cls.__table__.columns
+        )
+
     def to_dict(self, include_relationships: bool = False) -> Dict[str, Any]:
         """
         Convert model instance to dictionary.
@@ -59,20 +108,35 @@ class BaseModel(Base):
         """
         result = {}
 
-        # Include column attributes
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
+        # Include column attributes. Loaded values are read straight from
+        # __dict__ (a C-level dict lookup) rather than through the
+        # InstrumentedAttribute descriptor protocol; getattr is only used
+        # for expired or deferred attributes that need a load.
+        state_dict = self.__dict__
+        for name, is_uuid, is_datetime in self._columns_tuple():
+            value = state_dict.get(name, _MISSING)
+            if value is _MISSING:
+                value = getattr(self, name)
             # Convert UUID and datetime to string for JSON serialization
-            if isinstance(value, uuid.UUID):
-                value = str(value)
-            elif isinstance(value, datetime):
-                value = value.isoformat()
-            result[column.name] = value
-
-        # Include relationships if requested
+            if value is not None:
+                if is_uuid:
+                    value = str(value)
+                elif is_datetime:
+                    value = value.isoformat()
+            result[name] = value
+
+        # Include relationships if requested. Only relationships that are
+        # already loaded are serialized — touching an unloaded one would
+        # issue a lazy SELECT per instance (the N+1 pattern). Callers that
+        # need relationship data should eager-load it, e.g. with
+        # session.query(Cls).options(selectinload(Cls.rel)).
         if include_relationships:
+            unloaded = inspect(self).unloaded
             for relationship in self.__mapper__.relationships:
                 rel_name = relationship.key
+                if rel_name in unloaded:
+                    result[rel_name] = None
+                    continue
                 rel_value = getattr(self, rel_name)
 
                 if rel_value is None:
@@ -90,6 +154,125 @@ class BaseModel(Base):
 
         return result
 
+    @classmethod
+    def to_dict_batch(
+        cls, instances: Iterable["BaseModel"], include_relationships: bool = False
+    ) -> list:
+        """
+        Convert many model instances to dictionaries.
+
+        Relationship data is only included for relationships that were
+        eager-loaded on the query (e.g. via selectinload); unloaded
+        relationships are serialized as None instead of triggering one
+        lazy SELECT per instance.
+
+        Args:
+            instances: Model instances to convert
+            include_relationships: Whether to include relationship data
+
+        Returns:
+            List of dictionary representations
+        """
+        return [
+            instance.to_dict(include_relationships=include_relationships)
+            for instance in instances
+        ]
+
+    def _raw_dict(self) -> Dict[str, Any]:
+        """Column values without Python-side string conversion.
+
+        UUID and datetime values are left as-is; orjson serializes both
+        natively in C, so converting them here would only add overhead.
+        """
+        state_dict = self.__dict__
+        result = {}
+        for name, _, _ in self._columns_tuple():
+            value = state_dict.get(name, _MISSING)
+            if value is _MISSING:
+                value = getattr(self, name)
+            result[name] = value
+        return result
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the model instance directly to JSON bytes.
+
+        Skips the intermediate to_dict string conversions by letting
+        orjson handle UUID and datetime values natively.
+
+        Returns:
+            JSON document as bytes
+        """
+        return orjson.dumps(self._raw_dict(), default=_orjson_default)
+
+    @classmethod
+    def to_json_many(cls, instances: Iterable["BaseModel"]) -> bytes:
+        """
+        Serialize many model instances to a single JSON array.
+
+        Args:
+            instances: Model instances to serialize
+
+        Returns:
+            JSON array as bytes
+        """
+        return orjson.dumps(
+            [instance._raw_dict() for instance in instances],
+            default=_orjson_default,
+        )
+
+    # Chunk size for bulk inserts; keeps each statement comfortably under
+    # the PostgreSQL protocol's ~65535 bind-parameter limit.
+    _BULK_INSERT_CHUNK = 500
+
+    @classmethod
+    def bulk_insert(cls, session, rows: list) -> list:
+        """
+        Insert many rows with a single multi-values INSERT per chunk.
+
+        Compared to add_all + flush (one INSERT round trip per row), this
+        issues one statement per 500 rows of each key shape and returns
+        the generated primary keys via RETURNING. Rows are grouped by
+        key shape because a multi-VALUES INSERT needs an identical
+        column set per statement, and padding absent keys with None
+        would override server defaults instead of applying them.
+
+        Args:
+            session: SQLAlchemy session
+            rows: List of dictionaries with column data; omitted columns
+                fall back to their defaults
+
+        Returns:
+            List of generated primary key UUIDs, ordered to match rows
+        """
+        if not rows:
+            return []
+
+        # Filter unknown keys once, not per row
+        column_names = cls._column_names()
+        filtered_rows = [
+            {k: v for k, v in row.items() if k in column_names} for row in rows
+        ]
+
+        # Group row positions by key shape so heterogeneous input still
+        # compiles, then reassemble the ids in the caller's row order
+        groups: Dict[frozenset, list] = {}
+        for index, row in enumerate(filtered_rows):
+            groups.setdefault(frozenset(row), []).append(index)
+
+        ids = [None] * len(filtered_rows)
+        for indexes in groups.values():
+            for start in range(0, len(indexes), cls._BULK_INSERT_CHUNK):
+                batch = indexes[start : start + cls._BULK_INSERT_CHUNK]
+                result = session.execute(
+                    insert(cls)
+                    .values([filtered_rows[index] for index in batch])
+                    .returning(cls.id)
+                )
+                for index, new_id in zip(batch, result.scalars()):
+                    ids[index] = new_id
+        return ids
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BaseModel":
         """
@@ -102,7 +285,7 @@ class BaseModel(Base):
             Model instance
         """
         # Filter out non-column attributes
-        column_names = {column.name for column in cls.__table__.columns}
+        column_names = cls._column_names()
         filtered_data = {k: v for k, v in data.items() if k in column_names}
 
         # Convert string UUIDs back to UUID objects
@@ -118,7 +301,7 @@ class BaseModel(Base):
         Args:
             data: Dictionary with updated data
         """
-        column_names = {column.name for column in self.__table__.columns}
+        column_names = self._column_names()
 
         for key, value in data.items():
             if key in column_names and key not in ("id", "created_at"):
@@ -175,8 +358,14 @@ class SoftDeleteMixin:
         return self.deleted_at is not None
 
     def soft_delete(self) -> None:
-        """Soft delete the record."""
-        self.deleted_at = datetime.utcnow()
+        """Soft delete the record.
+
+        The timestamp is assigned as the SQL expression NOW(), so the
+        database fills in a timezone-aware value at commit time —
+        consistent with updated_at, and avoids the deprecated, naive
+        datetime.utcnow(). Read deleted_at back after a flush.
+        """
+        self.deleted_at = func.now()
 
     def restore(self) -> None:
         """Restore a soft deleted record."""
@@ -196,9 +385,17 @@ def get_model_by_table_name(table_name: str) -> Optional[type]:
     Returns:
         Model class or None if not found
     """
-    for cls in Base.registry._class_registry.values():
-        if hasattr(cls, "__tablename__") and cls.__tablename__ == table_name:
-            return cls
+    model = BaseModel._TABLE_INDEX.get(table_name)
+    if model is not None:
+        return model
+
+    # Fallback for models mapped without going through BaseModel's
+    # __init_subclass__ hook. registry.mappers is the public SQLAlchemy
+    # API — unlike _class_registry it contains only Mapper objects, with
+    # no weakref sentinels to filter out.
+    for mapper in Base.registry.mappers:
+        if mapper.local_table is not None and mapper.local_table.name == table_name:
+            return mapper.class_
     return None
 
 
@@ -209,14 +406,13 @@ def get_all_models() -> list:
     Returns:
         List of model classes
     """
-    models = []
-    for cls in Base.registry._class_registry.values():
-        if (
-            hasattr(cls, "__tablename__")
-            and hasattr(cls, "__table__")
-            and issubclass(cls, BaseModel)
-        ):
-            models.append(cls)
+    models = list(BaseModel._TABLE_INDEX.values())
+    seen = set(models)
+    models.extend(
+        mapper.class_
+        for mapper in Base.registry.mappers
+        if issubclass(mapper.class_, BaseModel) and mapper.class_ not in seen
+    )
     return models
 
 
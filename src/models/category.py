@@ -2,12 +2,32 @@
 Category model for the Inventory Management System.
 """
 
-from typing import List, Optional
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional
 import uuid
 
-from sqlalchemy import String, Text, ForeignKey
+from sqlalchemy import (
+    Integer,
+    String,
+    Text,
+    ForeignKey,
+    bindparam,
+    event,
+    inspect,
+    lambda_stmt,
+    select,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+    object_session,
+    relationship,
+    selectinload,
+    validates,
+)
+from sqlalchemy.orm.attributes import set_committed_value
 
 from .base import BaseModel, ActiveRecordMixin
 
@@ -32,6 +52,13 @@ class Category(BaseModel, ActiveRecordMixin):
         String(100), nullable=False, unique=True, index=True
     )
 
+    # Write-time lowercased copy of name, kept in sync by the validates
+    # hook below, so case-insensitive lookups compare a plain indexed
+    # column instead of case-folding per row or per query.
+    name_lower: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True, index=True
+    )
+
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Hierarchical relationship fields
@@ -42,6 +69,21 @@ class Category(BaseModel, ActiveRecordMixin):
         index=True,
     )
 
+    # Materialized path of ancestor ids ("/root_id/.../self_id/") and the
+    # depth in the hierarchy. These denormalize the parent chain so level,
+    # ancestor, and root lookups cost one string parse plus at most one
+    # query instead of one lazy load per tree level. The columns are
+    # backfilled by migration, populated for new rows by the after_insert
+    # listener at the bottom of this module, and maintained on reparent by
+    # move_to_parent; when path is NULL (a pre-backfill row under an
+    # unpathed parent), every consumer falls back to walking parent
+    # pointers.
+    path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True, index=True)
+
+    depth: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
     # Relationships
     parent: Mapped[Optional["Category"]] = relationship(
         "Category", remote_side="Category.id", back_populates="children"
@@ -51,11 +93,20 @@ class Category(BaseModel, ActiveRecordMixin):
         "Category", back_populates="parent", cascade="all, delete-orphan"
     )
 
-    # Relationship to products (will be defined in product.py)
+    # Relationship to products (will be defined in product.py). No ORM
+    # delete cascade: it would load and delete every product row in
+    # Python when a category is removed. The database FK is ON DELETE
+    # RESTRICT, so passive_deletes lets the constraint decide instead.
     products: Mapped[List["Product"]] = relationship(
-        "Product", back_populates="category", cascade="all, delete-orphan"
+        "Product", back_populates="category", passive_deletes=True
     )
 
+    @validates("name")
+    def _sync_name_lower(self, key, value):
+        """Keep name_lower in step with name on every assignment."""
+        self.name_lower = value.lower() if value is not None else None
+        return value
+
     def __repr__(self) -> str:
         """String representation of the category."""
         return f"<Category(id={self.id}, name='{self.name}')>"
@@ -72,14 +123,16 @@ class Category(BaseModel, ActiveRecordMixin):
         Returns:
             String representation of the category path (e.g., "Electronics > Computers > Laptops")
         """
-        path_parts = []
-        current = self
+        cached = getattr(self, "_cached_full_path", None)
+        if cached is not None:
+            return cached
 
-        while current:
-            path_parts.append(current.name)
-            current = current.parent
+        path_parts = [ancestor.name for ancestor in reversed(self.get_all_ancestors())]
+        path_parts.append(self.name)
 
-        return " > ".join(reversed(path_parts))
+        full_path = " > ".join(path_parts)
+        self._cached_full_path = full_path
+        return full_path
 
     @property
     def level(self) -> int:
@@ -89,6 +142,13 @@ class Category(BaseModel, ActiveRecordMixin):
         Returns:
             Integer representing the depth level
         """
+        if self.path:
+            return self.depth
+
+        cached = getattr(self, "_cached_level", None)
+        if cached is not None:
+            return cached
+
         level = 0
         current = self.parent
 
@@ -96,8 +156,14 @@ class Category(BaseModel, ActiveRecordMixin):
             level += 1
             current = current.parent
 
+        self._cached_level = level
         return level
 
+    def _ancestor_ids_from_path(self) -> List[uuid.UUID]:
+        """Parse ancestor ids (root first, self excluded) from the path column."""
+        parts = self.path.strip("/").split("/")
+        return [uuid.UUID(part) for part in parts[:-1]]
+
     @property
     def is_root(self) -> bool:
         """Check if this is a root category (no parent)."""
@@ -105,22 +171,169 @@ class Category(BaseModel, ActiveRecordMixin):
 
     @property
     def is_leaf(self) -> bool:
-        """Check if this is a leaf category (no children)."""
+        """Check if this is a leaf category (no children).
+
+        Answered with an EXISTS query when the children collection is not
+        loaded, instead of lazy-loading every child row for a boolean.
+        """
+        if "children" not in inspect(self).unloaded:
+            return len(self.children) == 0
+
+        session = object_session(self)
+        if session is not None and self.id is not None:
+            has_children = session.execute(
+                text("SELECT EXISTS (SELECT 1 FROM categories WHERE parent_id = :id)"),
+                {"id": self.id},
+            ).scalar()
+            return not has_children
+
         return len(self.children) == 0
 
+    @classmethod
+    def load_subtree(cls, session, root_id) -> Optional["Category"]:
+        """
+        Load a category with its entire descendant tree eagerly.
+
+        selectinload with unlimited recursion fetches each tree level
+        with one IN query, so the whole subtree costs O(depth) queries
+        instead of one lazy SELECT per node.
+
+        Args:
+            session: SQLAlchemy session
+            root_id: ID of the subtree root category
+
+        Returns:
+            Root Category object with children populated, or None
+        """
+        return (
+            session.query(cls)
+            .options(selectinload(cls.children, recursion_depth=-1))
+            .filter(cls.id == root_id)
+            .first()
+        )
+
     def get_all_descendants(self) -> List["Category"]:
         """
         Get all descendant categories (children, grandchildren, etc.).
 
+        If the instance is session-bound and its children have not been
+        loaded yet, the whole subtree is batch-loaded first so the
+        recursion below only touches the identity map.
+
+        An inactive category prunes its entire subtree: its descendants
+        are never reported, even if they are active themselves. All the
+        subtree traversals in this class (bulk_descendants,
+        descendant_ids_fast, get_descendant_product_count) share this
+        semantic.
+
         Returns:
             List of all descendant Category objects
         """
+        session = object_session(self)
+        if (
+            session is not None
+            and self.id is not None
+            and "children" in inspect(self).unloaded
+        ):
+            self.load_subtree(session, self.id)
+
         descendants = []
 
         for child in self.children:
-            if child.is_active:
-                descendants.append(child)
-                descendants.extend(child.get_all_descendants())
+            # Prune inactive subtrees, matching the WHERE c.is_active
+            # recursion step of the CTE-based traversals
+            if not child.is_active:
+                continue
+            descendants.append(child)
+            descendants.extend(child.get_all_descendants())
+
+        return descendants
+
+    @classmethod
+    def bulk_descendants(
+        cls, session, root_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, List[uuid.UUID]]:
+        """
+        Get the descendant ids for a whole batch of categories at once.
+
+        One recursive CTE walks all the requested subtrees together, so
+        dashboard-style pages that show many roots pay a single round
+        trip instead of one get_all_descendants traversal per root.
+        Inactive categories prune their entire subtree, matching
+        get_all_descendants.
+
+        Args:
+            session: SQLAlchemy session
+            root_ids: IDs of the subtree root categories
+
+        Returns:
+            Mapping of root id to the ids of its active descendants,
+            ordered by depth (roots without descendants are omitted)
+        """
+        if not root_ids:
+            return {}
+
+        rows = session.execute(
+            text(
+                """
+                WITH RECURSIVE t(root, id, depth) AS (
+                    SELECT id, id, 0 FROM categories WHERE id = ANY(:roots)
+                    UNION ALL
+                    SELECT t.root, c.id, t.depth + 1
+                    FROM categories c
+                    JOIN t ON c.parent_id = t.id
+                    WHERE c.is_active
+                )
+                SELECT root, id, depth
+                FROM t
+                WHERE depth > 0
+                ORDER BY root, depth
+                """
+            ),
+            {"roots": list(root_ids)},
+        )
+
+        descendants = defaultdict(list)
+        for root_id, node_id, _depth in rows:
+            descendants[root_id].append(node_id)
+
+        return dict(descendants)
+
+    @classmethod
+    def descendant_ids_fast(cls, session, root_id) -> List[uuid.UUID]:
+        """
+        Collect descendant ids from a single adjacency scan.
+
+        Loads all active (id, parent_id) pairs with one query, builds a
+        parent -> children adjacency map, and walks the subtree with an
+        explicit stack — no ORM objects, no per-node queries. Suited to
+        analytics paths that repeatedly traverse large trees; hydrate
+        individual categories with session.get afterwards if needed.
+        Inactive categories prune their entire subtree, matching
+        get_all_descendants.
+
+        Args:
+            session: SQLAlchemy session
+            root_id: ID of the subtree root category
+
+        Returns:
+            List of descendant ids (root excluded), depth-first order
+        """
+        rows = session.execute(
+            text("SELECT id, parent_id FROM categories WHERE is_active")
+        )
+
+        children_of = defaultdict(list)
+        for node_id, parent_id in rows:
+            if parent_id is not None:
+                children_of[parent_id].append(node_id)
+
+        descendants = []
+        stack = list(children_of.get(root_id, ()))
+        while stack:
+            node_id = stack.pop()
+            descendants.append(node_id)
+            stack.extend(children_of.get(node_id, ()))
 
         return descendants
 
@@ -128,9 +341,30 @@ class Category(BaseModel, ActiveRecordMixin):
         """
         Get all ancestor categories (parent, grandparent, etc.).
 
+        When the materialized path is populated, all ancestors are fetched
+        with a single IN query instead of one lazy load per level.
+
         Returns:
-            List of all ancestor Category objects
+            List of all ancestor Category objects (parent first)
         """
+        if self.path:
+            session = object_session(self)
+            if session is not None:
+                ancestor_ids = self._ancestor_ids_from_path()
+                if not ancestor_ids:
+                    return []
+
+                rows = (
+                    session.query(Category).filter(Category.id.in_(ancestor_ids)).all()
+                )
+                by_id = {category.id: category for category in rows}
+                # Reverse to match the walk order: parent first, root last
+                return [
+                    by_id[ancestor_id]
+                    for ancestor_id in reversed(ancestor_ids)
+                    if ancestor_id in by_id
+                ]
+
         ancestors = []
         current = self.parent
 
@@ -147,12 +381,28 @@ class Category(BaseModel, ActiveRecordMixin):
         Returns:
             Root Category object
         """
-        current = self
+        cached = getattr(self, "_cached_root", None)
+        if cached is not None:
+            return cached
 
-        while current.parent:
-            current = current.parent
+        root = None
+
+        if self.path:
+            root_id = uuid.UUID(self.path.strip("/").split("/", 1)[0])
+            if root_id == self.id:
+                root = self
+            else:
+                session = object_session(self)
+                if session is not None:
+                    root = session.get(Category, root_id)
 
-        return current
+        if root is None:
+            root = self
+            while root.parent:
+                root = root.parent
+
+        self._cached_root = root
+        return root
 
     def can_be_parent_of(self, potential_child: "Category") -> bool:
         """
@@ -168,9 +418,40 @@ class Category(BaseModel, ActiveRecordMixin):
         if potential_child == self:
             return False
 
-        # Check if potential_child is an ancestor of self
-        ancestors = self.get_all_ancestors()
-        return potential_child not in ancestors
+        # Materialized path: the ancestor check is a pure string test
+        if self.path and potential_child.id is not None:
+            return str(potential_child.id) not in self.path.strip("/").split("/")
+
+        # Session-bound: answer with one EXISTS query over a recursive
+        # CTE instead of one lazy load per tree level
+        session = object_session(self)
+        if session is not None and potential_child.id is not None:
+            if self.parent_id is None:
+                return True
+
+            is_ancestor = session.execute(
+                text(
+                    """
+                    SELECT EXISTS (
+                        WITH RECURSIVE anc(id, parent_id) AS (
+                            SELECT id, parent_id FROM categories WHERE id = :start
+                            UNION ALL
+                            SELECT c.id, c.parent_id
+                            FROM categories c
+                            JOIN anc ON c.id = anc.parent_id
+                        )
+                        SELECT 1 FROM anc WHERE id = :candidate
+                    )
+                    """
+                ),
+                {"start": self.parent_id, "candidate": potential_child.id},
+            ).scalar()
+            return not is_ancestor
+
+        # Detached fallback: compare ancestor ids via a set instead of a
+        # linear `not in` scan that runs ORM __eq__ per element
+        ancestor_ids = {ancestor.id for ancestor in self.get_all_ancestors()}
+        return potential_child.id not in ancestor_ids
 
     def move_to_parent(self, new_parent: Optional["Category"]) -> bool:
         """
@@ -185,25 +466,129 @@ class Category(BaseModel, ActiveRecordMixin):
         if new_parent is None:
             self.parent_id = None
             self.parent = None
+            self._invalidate_hierarchy_cache()
+            self._refresh_path()
             return True
 
         if new_parent.can_be_parent_of(self):
             self.parent_id = new_parent.id
             self.parent = new_parent
+            self._invalidate_hierarchy_cache()
+            self._refresh_path()
             return True
 
         return False
 
-    def get_product_count(self, include_descendants: bool = False) -> int:
+    def _invalidate_hierarchy_cache(self) -> None:
+        """Drop memoized full_path/level/root values after a reparent.
+
+        Descendant instances already loaded in the session keep their
+        memoized values; refresh them before reading hierarchy properties
+        again, as with the materialized path itself.
+        """
+        self.__dict__.pop("_cached_full_path", None)
+        self.__dict__.pop("_cached_level", None)
+        self.__dict__.pop("_cached_root", None)
+
+    def _refresh_path(self) -> None:
+        """
+        Recompute the materialized path/depth after a reparent.
+
+        Descendant rows are updated with a single prefix-rewrite UPDATE;
+        descendant instances already loaded in the session should be
+        refreshed before their path is read again.
+        """
+        if self.id is None:
+            # Not yet flushed; the after_insert listener computes the
+            # path once the server-generated id is known
+            return
+
+        old_path = self.path
+
+        if self.parent is not None:
+            if not self.parent.path:
+                # Moving under an unpathed (pre-backfill) parent: the
+                # subtree's old paths describe the previous hierarchy,
+                # so NULL them all out rather than leave stale strings
+                # feeding the ancestor fast paths.
+                self.path = None
+                session = object_session(self)
+                if session is not None and old_path:
+                    session.execute(
+                        text(
+                            """
+                            UPDATE categories
+                            SET path = NULL
+                            WHERE path LIKE :old_path || '%'
+                              AND id <> :self_id
+                            """
+                        ),
+                        {"old_path": old_path, "self_id": self.id},
+                    )
+                return
+            new_path = f"{self.parent.path}{self.id}/"
+            new_depth = self.parent.depth + 1
+        else:
+            new_path = f"/{self.id}/"
+            new_depth = 0
+
+        depth_delta = new_depth - (self.depth or 0)
+        self.path = new_path
+        self.depth = new_depth
+
+        session = object_session(self)
+        if session is not None and old_path and old_path != new_path:
+            session.execute(
+                text(
+                    """
+                    UPDATE categories
+                    SET path = :new_path || substr(path, length(:old_path) + 1),
+                        depth = depth + :depth_delta
+                    WHERE path LIKE :old_path || '%'
+                      AND id <> :self_id
+                    """
+                ),
+                {
+                    "new_path": new_path,
+                    "old_path": old_path,
+                    "depth_delta": depth_delta,
+                    "self_id": self.id,
+                },
+            )
+
+    def get_product_count(self, include_descendants: bool = False, session=None) -> int:
         """
         Get the number of products in this category.
 
+        When descendants are included and a session is available, the
+        count is computed with a single recursive query instead of
+        lazy-loading every child category and its products. Both paths
+        count only active products and prune inactive subtrees, so the
+        result does not depend on whether the instance is session-bound.
+
         Args:
             include_descendants: Whether to include products from descendant categories
+            session: SQLAlchemy session (defaults to the instance's session)
 
         Returns:
             Number of products
         """
+        session = session or object_session(self)
+
+        if include_descendants:
+            if session is not None:
+                return self.get_descendant_product_count(session, self.id)
+        elif session is not None and "products" in inspect(self).unloaded:
+            # Count server-side instead of loading every product row
+            count = session.execute(
+                text(
+                    "SELECT count(*) FROM products"
+                    " WHERE category_id = :id AND is_active"
+                ),
+                {"id": self.id},
+            ).scalar()
+            return count or 0
+
         count = len([p for p in self.products if p.is_active])
 
         if include_descendants:
@@ -212,6 +597,46 @@ class Category(BaseModel, ActiveRecordMixin):
 
         return count
 
+    @classmethod
+    def get_descendant_product_count(cls, session, root_id) -> int:
+        """
+        Count active products in a category subtree with one query.
+
+        A recursive CTE walks the hierarchy inside the database, so the
+        cost is a single round trip regardless of tree size — the ORM
+        walk it replaces issued one query per category plus one per
+        product collection. The semantics match the Python fallback in
+        get_product_count: the root's own products always count, and an
+        inactive descendant prunes its entire subtree.
+
+        Args:
+            session: SQLAlchemy session
+            root_id: ID of the subtree root category
+
+        Returns:
+            Number of active products in the subtree (root included)
+        """
+        result = session.execute(
+            text(
+                """
+                WITH RECURSIVE subtree(id) AS (
+                    SELECT id FROM categories WHERE id = :root
+                    UNION ALL
+                    SELECT c.id
+                    FROM categories c
+                    JOIN subtree s ON c.parent_id = s.id
+                    WHERE c.is_active
+                )
+                SELECT count(*)
+                FROM products p
+                JOIN subtree ON p.category_id = subtree.id
+                WHERE p.is_active
+                """
+            ),
+            {"root": root_id},
+        )
+        return result.scalar() or 0
+
     @classmethod
     def get_root_categories(cls, session) -> List["Category"]:
         """
@@ -225,11 +650,32 @@ class Category(BaseModel, ActiveRecordMixin):
         """
         return (
             session.query(cls)
-            .filter(cls.parent_id.is_(None), cls.is_active == True)
+            .filter(cls.parent_id.is_(None), cls.is_active.is_(True))
             .order_by(cls.name)
             .all()
         )
 
+    @classmethod
+    def get_root_categories_rows(cls, session) -> list:
+        """
+        Get (id, name) rows for all root categories.
+
+        Skips ORM instance hydration (identity map, attribute
+        instrumentation) for callers that only need values, e.g.
+        dropdowns.
+
+        Args:
+            session: SQLAlchemy session
+
+        Returns:
+            List of (id, name) Row objects
+        """
+        return session.execute(
+            select(cls.id, cls.name)
+            .where(cls.parent_id.is_(None), cls.is_active.is_(True))
+            .order_by(cls.name)
+        ).all()
+
     @classmethod
     def get_by_name(cls, session, name: str) -> Optional["Category"]:
         """
@@ -242,9 +688,7 @@ class Category(BaseModel, ActiveRecordMixin):
         Returns:
             Category object or None if not found
         """
-        return (
-            session.query(cls).filter(cls.name == name, cls.is_active == True).first()
-        )
+        return session.scalars(_GET_BY_NAME_STMT, {"name": name}).first()
 
     @classmethod
     def search_by_name(cls, session, search_term: str) -> List["Category"]:
@@ -258,31 +702,70 @@ class Category(BaseModel, ActiveRecordMixin):
         Returns:
             List of matching Category objects
         """
-        return (
-            session.query(cls)
-            .filter(cls.name.ilike(f"%{search_term}%"), cls.is_active == True)
+        return session.scalars(
+            _SEARCH_BY_NAME_STMT, {"pattern": f"%{search_term}%"}
+        ).all()
+
+    @classmethod
+    def search_by_name_rows(cls, session, search_term: str) -> list:
+        """
+        Search categories by name, returning lightweight (id, name) rows.
+
+        Args:
+            session: SQLAlchemy session
+            search_term: Search term
+
+        Returns:
+            List of (id, name) Row objects
+        """
+        return session.execute(
+            select(cls.id, cls.name)
+            .where(cls.name.ilike(f"%{search_term}%"), cls.is_active.is_(True))
             .order_by(cls.name)
-            .all()
-        )
+        ).all()
 
-    def to_dict(self, include_relationships: bool = False) -> dict:
+    def to_dict(
+        self, include_relationships: bool = False, fields: Optional[set] = None
+    ) -> dict:
         """
         Convert category to dictionary with additional computed fields.
 
+        The common case builds the result as one dict literal instead of
+        per-key assignments. The computed fields can each cost a query
+        on an instance whose relationships are not loaded, so callers
+        that only need a subset (e.g. flat pick lists) pass ``fields``
+        to skip the rest.
+
         Args:
             include_relationships: Whether to include relationship data
+            fields: Optional set restricting which computed fields
+                (full_path, level, is_root, is_leaf, product_count) are
+                included; None includes them all
 
         Returns:
             Dictionary representation
         """
-        result = super().to_dict(include_relationships=False)
-
-        # Add computed fields
-        result["full_path"] = self.full_path
-        result["level"] = self.level
-        result["is_root"] = self.is_root
-        result["is_leaf"] = self.is_leaf
-        result["product_count"] = self.get_product_count()
+        if fields is None:
+            result = {
+                **super().to_dict(include_relationships=False),
+                "full_path": self.full_path,
+                "level": self.level,
+                "is_root": self.is_root,
+                "is_leaf": self.is_leaf,
+                "product_count": self.get_product_count(),
+            }
+        else:
+            result = super().to_dict(include_relationships=False)
+            if "full_path" in fields:
+                result["full_path"] = self.full_path
+            if "level" in fields:
+                result["level"] = self.level
+            if "is_root" in fields:
+                result["is_root"] = self.is_root
+            if "is_leaf" in fields:
+                result["is_leaf"] = self.is_leaf
+            if "product_count" in fields:
+                result["product_count"] = self.get_product_count()
 
         if include_relationships:
             # Include parent info (without full recursion)
@@ -298,5 +781,60 @@ class Category(BaseModel, ActiveRecordMixin):
         return result
 
 
-# Import here to avoid circular imports
-from .product import Product
+# Precompiled statements for the high-frequency getters. lambda_stmt
+# caches the compiled SQL, so repeated calls skip statement construction
+# and compilation and only bind new parameter values.
+_GET_BY_NAME_STMT = lambda_stmt(
+    lambda: select(Category).where(
+        Category.name == bindparam("name"), Category.is_active.is_(True)
+    )
+)
+
+_SEARCH_BY_NAME_STMT = lambda_stmt(
+    lambda: select(Category)
+    .where(Category.name.ilike(bindparam("pattern")), Category.is_active.is_(True))
+    .order_by(Category.name)
+)
+
+
+# Path/depth are derived from the parent row server-side; if the parent
+# predates the backfill and has no path, path stays NULL and consumers
+# fall back to walking parent pointers.
+_SET_PATH_SQL = text(
+    """
+    UPDATE categories
+    SET path = CASE
+            WHEN parent_id IS NULL THEN '/' || id::text || '/'
+            ELSE (SELECT p.path FROM categories p WHERE p.id = categories.parent_id)
+                 || id::text || '/'
+        END,
+        depth = CASE
+            WHEN parent_id IS NULL THEN 0
+            ELSE (SELECT p.depth FROM categories p
+                  WHERE p.id = categories.parent_id) + 1
+        END
+    WHERE id = :id
+    RETURNING path, depth
+    """
+)
+
+
+@event.listens_for(Category, "after_insert")
+def _category_populate_path(mapper, connection, target):
+    """Populate path/depth for a freshly inserted category.
+
+    The id is server-generated, so the materialized path can only be
+    computed once the INSERT has returned it; one follow-up UPDATE per
+    insert keeps the column populated without a database trigger.
+    """
+    row = connection.execute(_SET_PATH_SQL, {"id": target.id}).first()
+    if row is not None:
+        set_committed_value(target, "path", row.path)
+        set_committed_value(target, "depth", row.depth)
+
+
+# Only type checkers need the real class; the "Product" relationship
+# string lets SQLAlchemy resolve the mapping lazily, so skipping the
+# runtime import keeps module load time down.
+if TYPE_CHECKING:
+    from .product import Product  # noqa: F401
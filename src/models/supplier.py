@@ -2,11 +2,20 @@
 Supplier model for the Inventory Management System.
 """
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from decimal import Decimal
 
-from sqlalchemy import String, Text, Integer
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    String,
+    Text,
+    Integer,
+    bindparam,
+    inspect,
+    lambda_stmt,
+    select,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column, object_session, relationship
 
 from .base import BaseModel, ActiveRecordMixin
 
@@ -83,18 +92,8 @@ class Supplier(BaseModel, ActiveRecordMixin):
         Returns:
             Formatted address string
         """
-        address_parts = []
-
-        if self.address:
-            address_parts.append(self.address)
-        if self.city:
-            address_parts.append(self.city)
-        if self.postal_code:
-            address_parts.append(self.postal_code)
-        if self.country:
-            address_parts.append(self.country)
-
-        return ", ".join(filter(None, address_parts))
+        parts = (self.address, self.city, self.postal_code, self.country)
+        return ", ".join(part for part in parts if part)
 
     @property
     def display_name(self) -> str:
@@ -115,57 +114,154 @@ class Supplier(BaseModel, ActiveRecordMixin):
 
     @property
     def product_count(self) -> int:
-        """Get the number of active products from this supplier."""
+        """Get the number of active products from this supplier.
+
+        Counted server-side when the products collection is not loaded,
+        so list serialization does not pull every product row of every
+        supplier just to report a number.
+        """
+        if "products" not in inspect(self).unloaded:
+            return len([p for p in self.products if p.is_active])
+
+        session = object_session(self)
+        if session is not None:
+            count = session.execute(
+                text(
+                    "SELECT count(*) FROM products"
+                    " WHERE supplier_id = :id AND is_active"
+                ),
+                {"id": self.id},
+            ).scalar()
+            return count or 0
+
         return len([p for p in self.products if p.is_active])
 
-    def get_products_by_category(self, category_name: str) -> List["Product"]:
+    def get_products_by_category(
+        self, category_name: str, session=None
+    ) -> List["Product"]:
         """
         Get products from this supplier filtered by category.
 
+        When a session is available the case-insensitive category match
+        is pushed into SQL against the indexed categories.name_lower
+        column instead of lazy-loading every product's category and
+        comparing in Python.
+
         Args:
             category_name: Name of the category to filter by
+            session: SQLAlchemy session (defaults to the instance's session)
 
         Returns:
             List of Product objects
         """
+        needle = category_name.lower()
+        session = session or object_session(self)
+        if session is not None:
+            rows = session.execute(
+                text(
+                    """
+                    SELECT p.id
+                    FROM products p
+                    JOIN categories c ON p.category_id = c.id
+                    WHERE p.supplier_id = :supplier_id
+                      AND p.is_active
+                      AND c.name_lower = :needle
+                    """
+                ),
+                {"supplier_id": self.id, "needle": needle},
+            )
+            matching_ids = {row[0] for row in rows}
+            return [product for product in self.products if product.id in matching_ids]
+
         return [
             product
             for product in self.products
             if (
                 product.is_active
                 and product.category
-                and product.category.name.lower() == category_name.lower()
+                and product.category.name_lower == needle
             )
         ]
 
-    def get_total_inventory_value(self) -> Decimal:
+    def get_total_inventory_value(self, session=None) -> Decimal:
         """
         Calculate total inventory value for products from this supplier.
 
+        When a session is available the multiplication and aggregation
+        are pushed down to the database as a single SUM query; the
+        Python loop (one lazy load per product plus one per inventory
+        collection) only runs for detached instances.
+
+        Args:
+            session: SQLAlchemy session (defaults to the instance's session)
+
         Returns:
             Total value as Decimal
         """
-        total = Decimal("0.00")
-
-        for product in self.products:
-            if product.is_active and product.unit_cost:
-                # Get current inventory quantity
-                for inventory in product.inventory:
-                    if inventory.quantity_available > 0:
-                        total += (
-                            Decimal(str(inventory.quantity_available))
-                            * product.unit_cost
-                        )
-
-        return total
+        session = session or object_session(self)
+        if session is not None:
+            total = session.execute(
+                text(
+                    """
+                    SELECT COALESCE(SUM(i.quantity_available * p.unit_cost), 0)
+                    FROM products p
+                    JOIN inventory i ON i.product_id = p.id
+                    WHERE p.supplier_id = :supplier_id
+                      AND p.is_active
+                      AND p.unit_cost IS NOT NULL
+                      AND i.quantity_available > 0
+                    """
+                ),
+                {"supplier_id": self.id},
+            ).scalar()
+            return Decimal(str(total))
+
+        # Decimal(int) skips the two string allocations Decimal(str(int))
+        # pays per row; a single sum() avoids rebinding the accumulator
+        return sum(
+            (
+                Decimal(inventory.quantity_available) * product.unit_cost
+                for product in self.products
+                if product.is_active and product.unit_cost
+                for inventory in product.inventory
+                if inventory.quantity_available > 0
+            ),
+            Decimal("0.00"),
+        )
 
-    def get_low_stock_products(self) -> List["Product"]:
+    def get_low_stock_products(self, session=None) -> List["Product"]:
         """
         Get products from this supplier that are below reorder point.
 
+        When a session is available the low-stock check runs as a single
+        JOIN query; only the matching products are then picked from the
+        products relationship instead of lazy-loading every product's
+        inventory collection.
+
+        Args:
+            session: SQLAlchemy session (defaults to the instance's session)
+
         Returns:
             List of Product objects with low stock
         """
+        session = session or object_session(self)
+        if session is not None:
+            rows = session.execute(
+                text(
+                    """
+                    SELECT DISTINCT p.id
+                    FROM products p
+                    JOIN inventory i ON i.product_id = p.id
+                    WHERE p.supplier_id = :supplier_id
+                      AND p.is_active
+                      AND i.quantity_available <= p.reorder_point
+                    """
+                ),
+                {"supplier_id": self.id},
+            )
+            low_stock_ids = {row[0] for row in rows}
+            return [product for product in self.products if product.id in low_stock_ids]
+
         low_stock = []
 
         for product in self.products:
@@ -232,9 +328,7 @@ class Supplier(BaseModel, ActiveRecordMixin):
         Returns:
             Supplier object or None if not found
         """
-        return (
-            session.query(cls).filter(cls.name == name, cls.is_active == True).first()
-        )
+        return session.scalars(_GET_BY_NAME_STMT, {"name": name}).first()
 
     @classmethod
     def search_by_name(cls, session, search_term: str) -> List["Supplier"]:
@@ -248,12 +342,30 @@ class Supplier(BaseModel, ActiveRecordMixin):
         Returns:
             List of matching Supplier objects
         """
-        return (
-            session.query(cls)
-            .filter(cls.name.ilike(f"%{search_term}%"), cls.is_active == True)
+        return session.scalars(
+            _SEARCH_BY_NAME_STMT, {"pattern": f"%{search_term}%"}
+        ).all()
+
+    @classmethod
+    def search_by_name_rows(cls, session, search_term: str) -> list:
+        """
+        Search suppliers by name, returning lightweight (id, name) rows.
+
+        Skips ORM instance hydration for callers that only need values,
+        e.g. search suggestions.
+
+        Args:
+            session: SQLAlchemy session
+            search_term: Search term
+
+        Returns:
+            List of (id, name) Row objects
+        """
+        return session.execute(
+            select(cls.id, cls.name)
+            .where(cls.name.ilike(f"%{search_term}%"), cls.is_active.is_(True))
             .order_by(cls.name)
-            .all()
-        )
+        ).all()
 
     @classmethod
     def get_by_city(cls, session, city: str) -> List["Supplier"]:
@@ -267,12 +379,7 @@ class Supplier(BaseModel, ActiveRecordMixin):
         Returns:
             List of Supplier objects
         """
-        return (
-            session.query(cls)
-            .filter(cls.city.ilike(f"%{city}%"), cls.is_active == True)
-            .order_by(cls.name)
-            .all()
-        )
+        return session.scalars(_GET_BY_CITY_STMT, {"pattern": f"%{city}%"}).all()
 
     @classmethod
     def get_by_country(cls, session, country: str) -> List["Supplier"]:
@@ -286,12 +393,7 @@ class Supplier(BaseModel, ActiveRecordMixin):
         Returns:
             List of Supplier objects
         """
-        return (
-            session.query(cls)
-            .filter(cls.country.ilike(f"%{country}%"), cls.is_active == True)
-            .order_by(cls.name)
-            .all()
-        )
+        return session.scalars(_GET_BY_COUNTRY_STMT, {"pattern": f"%{country}%"}).all()
 
     @classmethod
     def get_with_email(cls, session) -> List["Supplier"]:
@@ -304,30 +406,46 @@ class Supplier(BaseModel, ActiveRecordMixin):
         Returns:
             List of Supplier objects with email
         """
-        return (
-            session.query(cls)
-            .filter(cls.email.isnot(None), cls.email != "", cls.is_active == True)
-            .order_by(cls.name)
-            .all()
-        )
+        return session.scalars(_GET_WITH_EMAIL_STMT).all()
 
-    def to_dict(self, include_relationships: bool = False) -> dict:
+    def to_dict(
+        self, include_relationships: bool = False, fields: Optional[set] = None
+    ) -> dict:
         """
         Convert supplier to dictionary with additional computed fields.
 
+        The common case builds the result as one dict literal instead of
+        per-key assignments. product_count costs a query on an instance
+        whose products are not loaded, so callers that don't need it
+        (or the other computed fields) pass ``fields`` to skip them.
+
         Args:
             include_relationships: Whether to include relationship data
+            fields: Optional set restricting which computed fields
+                (full_address, display_name, has_contact_info,
+                product_count) are included; None includes them all
 
         Returns:
             Dictionary representation
         """
-        result = super().to_dict(include_relationships=False)
-
-        # Add computed fields
-        result["full_address"] = self.full_address
-        result["display_name"] = self.display_name
-        result["has_contact_info"] = self.has_contact_info
-        result["product_count"] = self.product_count
+        if fields is None:
+            result = {
+                **super().to_dict(include_relationships=False),
+                "full_address": self.full_address,
+                "display_name": self.display_name,
+                "has_contact_info": self.has_contact_info,
+                "product_count": self.product_count,
+            }
+        else:
+            result = super().to_dict(include_relationships=False)
+            if "full_address" in fields:
+                result["full_address"] = self.full_address
+            if "display_name" in fields:
+                result["display_name"] = self.display_name
+            if "has_contact_info" in fields:
+                result["has_contact_info"] = self.has_contact_info
+            if "product_count" in fields:
+                result["product_count"] = self.product_count
 
         if include_relationships:
             # Include basic product info
@@ -344,5 +462,44 @@ class Supplier(BaseModel, ActiveRecordMixin):
         return result
 
 
-# Import here to avoid circular imports
-from .product import Product
+# Precompiled statements for the high-frequency getters. lambda_stmt
+# caches the compiled SQL, so repeated calls skip statement construction
+# and compilation and only bind new parameter values.
+_GET_BY_NAME_STMT = lambda_stmt(
+    lambda: select(Supplier).where(
+        Supplier.name == bindparam("name"), Supplier.is_active.is_(True)
+    )
+)
+
+_SEARCH_BY_NAME_STMT = lambda_stmt(
+    lambda: select(Supplier)
+    .where(Supplier.name.ilike(bindparam("pattern")), Supplier.is_active.is_(True))
+    .order_by(Supplier.name)
+)
+
+_GET_BY_CITY_STMT = lambda_stmt(
+    lambda: select(Supplier)
+    .where(Supplier.city.ilike(bindparam("pattern")), Supplier.is_active.is_(True))
+    .order_by(Supplier.name)
+)
+
+_GET_BY_COUNTRY_STMT = lambda_stmt(
+    lambda: select(Supplier)
+    .where(Supplier.country.ilike(bindparam("pattern")), Supplier.is_active.is_(True))
+    .order_by(Supplier.name)
+)
+
+_GET_WITH_EMAIL_STMT = lambda_stmt(
+    lambda: select(Supplier)
+    .where(
+        Supplier.email.isnot(None), Supplier.email != "", Supplier.is_active.is_(True)
+    )
+    .order_by(Supplier.name)
+)
+
+
+# Only type checkers need the real class; the "Product" relationship
+# string lets SQLAlchemy resolve the mapping lazily, so skipping the
+# runtime import keeps module load time down.
+if TYPE_CHECKING:
+    from .product import Product  # noqa: F401